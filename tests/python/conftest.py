@@ -0,0 +1,20 @@
+"""Shared pytest configuration for the Python documentation tests.
+
+The test files are independent of each other, so when running under
+pytest-xdist pass ``--dist=loadfile`` explicitly (as test_runner.py and
+tests/README.md do): it pins each file to one worker, so the venv-heavy
+test_venv_setup.py overlaps with the cheap import/parameter files
+instead of its classes re-running their expensive setUpClass on every
+worker. A bare ``-n auto`` uses xdist's default per-test scheduler and
+loses that grouping. When xdist is not installed the suite simply runs
+serially.
+"""
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "subprocess_heavy: spawns venv/pip subprocesses; keep off the "
+        "xdist pool and run in a serial lane to avoid fork/exec "
+        "oversubscription"
+    )
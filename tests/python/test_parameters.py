@@ -5,264 +5,180 @@ Test ALL documented Python API parameter combinations from claude.md
 Validates every parameter example shown in the documentation
 """
 
+import importlib.util
+import inspect
+import re
 import unittest
 import sys
 import os
 
+# Probe the finder once at module load; find_spec checks availability
+# without executing the package __init__
+_SDK_AVAILABLE = importlib.util.find_spec("vaultsfyi") is not None
+
+_SDK_SKIP_REASON = "vaultsfyi SDK not available (expected if not public yet)"
+
+# Bind the constructor once; one IMPORT at module load instead of one per
+# use site
+if _SDK_AVAILABLE:
+    from vaultsfyi import VaultsSdk as _VaultsSdk
+else:
+    _VaultsSdk = None
+
+# All networks from documentation (lines 28-42); built once, with a
+# frozenset companion for O(1) membership checks
+_DOCUMENTED_NETWORKS = (
+    'arbitrum', 'base', 'berachain', 'bsc', 'celo',
+    'gnosis', 'ink', 'mainnet', 'optimism', 'polygon',
+    'swellchain', 'unichain', 'worldchain'
+)
+_NETWORK_SET = frozenset(_DOCUMENTED_NETWORKS)
+
+# Precompiled validators for the documented constant tables; binding
+# fullmatch keeps the per-element work to a single C-level regex step
+_LOWER_NAME = re.compile(r'[a-z][a-z0-9]*').fullmatch
+_UPPER_SYMBOL = re.compile(r'[A-Z][A-Z0-9]*').fullmatch
+
+# The dynamic-fetching example needs requests for its fallback branch and
+# for the mock patch target; probe without importing
+_HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
+# Shared example fixtures from the documentation; hoisted so every case
+# references one string object instead of carrying its own literal
+USER_ADDR = '0xdB79e7E9e1412457528e40db9fCDBe69f558777d'
+VAULT_ADDR = '0x1234567890123456789012345678901234567890'
+ASSET_ADDR = '0xA0b86a33E6441f3F56F2B05e7b4B8B7F5A5f0e1B'
+NETWORK = 'mainnet'
+
+# Every documented (endpoint, parameter combination) from claude.md, with
+# the documentation line references each example came from
+CASES = [
+    # get_benchmarks (lines 174-176)
+    ('get_benchmarks', {
+        'network': NETWORK,    # Required: 'mainnet', 'base', 'arbitrum', etc.
+        'code': 'usd'          # Required: 'usd' or 'eth'
+    }),
+    # get_historical_benchmarks (lines 216-225)
+    ('get_historical_benchmarks', {
+        'network': NETWORK,
+        'code': 'usd',
+        'page': 0,
+        'per_page': 100,
+        'from_timestamp': 1640995200,
+        'to_timestamp': 1672531200
+    }),
+    # get_all_vaults credit-efficient filtering (lines 79-84)
+    ('get_all_vaults', {
+        'network': NETWORK,
+        'assetSymbol': 'USDC',
+        'onlyTransactional': True
+    }),
+    # get_all_vaults pagination (line 87)
+    ('get_all_vaults', {'page': 0, 'perPage': 50}),
+    # get_vault (lines 358-362)
+    ('get_vault', {
+        'network': NETWORK,
+        'vault_address': VAULT_ADDR
+    }),
+    # get_vault_historical_data common query parameters (lines 434-439)
+    ('get_vault_historical_data', {
+        'network': NETWORK,
+        'vault_address': VAULT_ADDR,
+        'apyInterval': '7day',
+        'fromTimestamp': 1640995200,
+        'toTimestamp': 1672531200,
+        'page': 0,
+        'perPage': 100
+    }),
+    # get_positions (lines 463-465)
+    ('get_positions', {
+        'user_address': USER_ADDR
+    }),
+    # get_deposit_options (lines 518-522 and 551-554)
+    ('get_deposit_options', {
+        'user_address': USER_ADDR,
+        'allowed_assets': ['USDC', 'USDS'],
+        'allowedNetworks': ['mainnet', 'base'],
+        'disallowedNetworks': ['arbitrum']
+    }),
+    # get_deposit_options credit-efficient filtering (lines 89-93)
+    ('get_deposit_options', {
+        'user_address': '0x...',
+        'allowed_assets': ['USDC', 'USDT']
+    }),
+    # get_idle_assets (lines 590-592)
+    ('get_idle_assets', {
+        'user_address': USER_ADDR
+    }),
+    # get_actions (lines 618-625)
+    ('get_actions', {
+        'action': 'deposit',
+        'user_address': USER_ADDR,
+        'network': NETWORK,
+        'vault_address': VAULT_ADDR,
+        'amount': '1000000000',
+        'asset_address': ASSET_ADDR,
+        'simulate': True
+    }),
+    # get_transactions_context (lines 712-716)
+    ('get_transactions_context', {
+        'user_address': USER_ADDR,
+        'network': NETWORK,
+        'vault_address': VAULT_ADDR
+    }),
+    # get_vault_holder_events (lines 726-730)
+    ('get_vault_holder_events', {
+        'user_address': USER_ADDR,
+        'network': NETWORK,
+        'vault_address': VAULT_ADDR
+    }),
+    # get_vault_total_returns (lines 739-743)
+    ('get_vault_total_returns', {
+        'user_address': USER_ADDR,
+        'network': NETWORK,
+        'vault_address': VAULT_ADDR
+    }),
+]
+
 
 class TestDocumentedParameterCombinations(unittest.TestCase):
     """Test ALL documented parameter combinations from claude.md"""
-    
-    def setUp(self):
-        """Check if SDK is available before running tests"""
-        try:
-            import vaultsfyi
-            self.sdk_available = True
-        except ImportError:
-            self.sdk_available = False
-    
-    def test_get_benchmarks_parameters(self):
-        """Test get_benchmarks with all documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from documentation (lines 174-176)
-        def benchmark_call():
-            return client.get_benchmarks(
-                network='mainnet',  # Required: 'mainnet', 'base', 'arbitrum', etc.
-                code='usd'         # Required: 'usd' or 'eth'
-            )
-        
-        # Should not raise syntax errors
-        self.assertTrue(callable(benchmark_call))
-        self.assertTrue(hasattr(client, 'get_benchmarks'))
-    
-    def test_get_historical_benchmarks_parameters(self):
-        """Test get_historical_benchmarks with all documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from documentation (lines 216-225)
-        def historical_call():
-            return client.get_historical_benchmarks(
-                network='mainnet',                        # Required
-                code='usd',                              # Required
-                page=0,                                  # Optional: page number
-                per_page=100,                            # Optional: items per page
-                from_timestamp=1640995200,               # Optional: start time
-                to_timestamp=1672531200                  # Optional: end time
-            )
-        
-        self.assertTrue(callable(historical_call))
-        self.assertTrue(hasattr(client, 'get_historical_benchmarks'))
-    
-    def test_get_all_vaults_credit_efficient_parameters(self):
-        """Test get_all_vaults with credit-efficient filtering parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from credit-efficient example (lines 79-84)
-        def specific_vaults_call():
-            return client.get_all_vaults(
-                network='mainnet',
-                assetSymbol='USDC',
-                onlyTransactional=True
-            )
-        
-        # Pagination example (line 87)
-        def paginated_call():
-            return client.get_all_vaults(page=0, perPage=50)
-        
-        self.assertTrue(callable(specific_vaults_call))
-        self.assertTrue(callable(paginated_call))
-        self.assertTrue(hasattr(client, 'get_all_vaults'))
-    
-    def test_get_vault_parameters(self):
-        """Test get_vault with all documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from documentation (lines 358-362)
-        def vault_call():
-            return client.get_vault(
-                network='mainnet',        # Required: network name
-                vault_address='0x1234567890123456789012345678901234567890'  # Required: vault contract address
-            )
-        
-        self.assertTrue(callable(vault_call))
-        self.assertTrue(hasattr(client, 'get_vault'))
-    
-    def test_get_vault_historical_data_parameters(self):
-        """Test get_vault_historical_data with all documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Parameters based on documentation common query parameters (lines 434-439)
-        def historical_data_call():
-            return client.get_vault_historical_data(
-                network='mainnet',        # Required
-                vault_address='0x1234567890123456789012345678901234567890',  # Required
-                apyInterval='7day',       # Optional: '1day', '7day', '30day'
-                fromTimestamp=1640995200, # Optional: Unix timestamp
-                toTimestamp=1672531200,   # Optional: Unix timestamp
-                page=0,                   # Optional: page number
-                perPage=100               # Optional: items per page
-            )
-        
-        self.assertTrue(callable(historical_data_call))
-        self.assertTrue(hasattr(client, 'get_vault_historical_data'))
-    
-    def test_get_positions_parameters(self):
-        """Test get_positions with documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from documentation (lines 463-465)
-        def positions_call():
-            return client.get_positions(
-                user_address='0xdB79e7E9e1412457528e40db9fCDBe69f558777d'   # Required: user's wallet address
-            )
-        
-        self.assertTrue(callable(positions_call))
-        self.assertTrue(hasattr(client, 'get_positions'))
-    
-    def test_get_deposit_options_parameters(self):
-        """Test get_deposit_options with all documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from documentation (lines 518-522 and 551-554)
-        def deposit_options_call():
-            return client.get_deposit_options(
-                user_address='0xdB79e7E9e1412457528e40db9fCDBe69f558777d',  # Required
-                allowed_assets=['USDC', 'USDS'],                            # Optional: ['USDC', 'USDS']
-                allowedNetworks=['mainnet', 'base'],                        # List of network names
-                disallowedNetworks=['arbitrum']                             # List of networks to exclude
-            )
-        
-        # Credit-efficient filtering example (lines 89-93)
-        def credit_efficient_call():
-            return client.get_deposit_options(
-                user_address='0x...',
-                allowed_assets=['USDC', 'USDT']
-            )
-        
-        self.assertTrue(callable(deposit_options_call))
-        self.assertTrue(callable(credit_efficient_call))
-        self.assertTrue(hasattr(client, 'get_deposit_options'))
-    
-    def test_get_idle_assets_parameters(self):
-        """Test get_idle_assets with documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from documentation (lines 590-592)
-        def idle_assets_call():
-            return client.get_idle_assets(
-                user_address='0xdB79e7E9e1412457528e40db9fCDBe69f558777d'   # Required
-            )
-        
-        self.assertTrue(callable(idle_assets_call))
-        self.assertTrue(hasattr(client, 'get_idle_assets'))
-    
-    def test_get_actions_complete_parameters(self):
-        """Test get_actions with all documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        # Exact parameters from documentation (lines 618-625)
-        def actions_call():
-            return client.get_actions(
-                action='deposit',                          # Required: 'deposit', 'redeem', etc.
-                user_address='0xdB79e7E9e1412457528e40db9fCDBe69f558777d',     # Required
-                network='mainnet',                         # Required
-                vault_address='0x1234567890123456789012345678901234567890',   # Required
-                amount='1000000000',                       # Optional: amount in wei
-                asset_address='0xA0b86a33E6441f3F56F2B05e7b4B8B7F5A5f0e1B',  # Optional: asset contract address
-                simulate=True                              # Optional: simulate transaction
-            )
-        
-        self.assertTrue(callable(actions_call))
-        self.assertTrue(hasattr(client, 'get_actions'))
-    
-    def test_remaining_endpoints_parameters(self):
-        """Test remaining endpoints with documented parameters"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        client = VaultsSdk(api_key="test_key")
-        
-        user_address = '0xdB79e7E9e1412457528e40db9fCDBe69f558777d'
-        network = 'mainnet'
-        vault_address = '0x1234567890123456789012345678901234567890'
-        
-        # get_transactions_context (lines 712-716)
-        def context_call():
-            return client.get_transactions_context(
-                user_address=user_address,   # Required
-                network=network,             # Required
-                vault_address=vault_address  # Required
-            )
-        
-        # get_vault_holder_events (lines 726-730)
-        def events_call():
-            return client.get_vault_holder_events(
-                user_address=user_address,   # Required
-                network=network,             # Required
-                vault_address=vault_address  # Required
-            )
-        
-        # get_vault_total_returns (lines 739-743)
-        def returns_call():
-            return client.get_vault_total_returns(
-                user_address=user_address,   # Required
-                network=network,             # Required
-                vault_address=vault_address  # Required
-            )
-        
-        self.assertTrue(callable(context_call))
-        self.assertTrue(callable(events_call))
-        self.assertTrue(callable(returns_call))
-        
-        self.assertTrue(hasattr(client, 'get_transactions_context'))
-        self.assertTrue(hasattr(client, 'get_vault_holder_events'))
-        self.assertTrue(hasattr(client, 'get_vault_total_returns'))
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one shared client; every test only introspects it"""
+        if _SDK_AVAILABLE:
+            cls.client = _VaultsSdk(api_key="test_key")
+
+    @unittest.skipUnless(_SDK_AVAILABLE, _SDK_SKIP_REASON)
+    def test_sdk_surface(self):
+        """Test that every documented endpoint method exists on the client"""
+        expected = ('get_benchmarks', 'get_historical_benchmarks', 'get_all_vaults',
+                    'get_vault', 'get_vault_historical_data', 'get_positions',
+                    'get_deposit_options', 'get_idle_assets', 'get_actions',
+                    'get_transactions_context', 'get_vault_holder_events',
+                    'get_vault_total_returns')
+        for name in expected:
+            with self.subTest(method=name):
+                self.assertTrue(hasattr(self.client, name))
+
+    @unittest.skipUnless(_SDK_AVAILABLE, _SDK_SKIP_REASON)
+    def test_endpoint_signatures(self):
+        """Test every documented parameter combination binds to its endpoint"""
+        for name, kwargs in CASES:
+            with self.subTest(endpoint=name, params=tuple(kwargs)):
+                method = getattr(self.client, name, None)
+                self.assertIsNotNone(method, f"{name} method not found")
+                # bind_partial raises TypeError if the documented keywords
+                # don't fit the real signature
+                try:
+                    inspect.signature(method).bind_partial(**kwargs)
+                except TypeError as e:
+                    self.fail(f"{name} does not accept documented parameters: {e}")
+
+    @unittest.skipUnless(_SDK_AVAILABLE, _SDK_SKIP_REASON)
     def test_documented_best_yields_function(self):
         """Test the exact best yields function from documentation"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        
         # Exact function from documentation (lines 783-795)
         def find_best_yields(client, user_address, allowed_assets=['USDC'], allowed_networks=['mainnet']):
             """
@@ -274,26 +190,25 @@ class TestDocumentedParameterCombinations(unittest.TestCase):
                 allowed_assets=allowed_assets,
                 allowedNetworks=allowed_networks
             )
-            
+
             # The API already returns sorted best options per asset
             return deposit_options
-        
-        client = VaultsSdk(api_key="test_key")
-        
-        # Test function structure
-        self.assertTrue(callable(find_best_yields))
-        
-        # Test that it uses the correct method
-        self.assertTrue(hasattr(client, 'get_deposit_options'))
-    
+
+        # The documented call must fit the real signature; bind_partial
+        # raises TypeError on a mismatch (as in test_endpoint_signatures)
+        try:
+            inspect.signature(self.client.get_deposit_options).bind_partial(
+                user_address=USER_ADDR,
+                allowed_assets=['USDC'],
+                allowedNetworks=['mainnet']
+            )
+        except TypeError as e:
+            self.fail(f"get_deposit_options does not accept documented parameters: {e}")
+
+    @unittest.skipUnless(_SDK_AVAILABLE, _SDK_SKIP_REASON)
+    @unittest.skipUnless(_HAS_REQUESTS, "requests not available")
     def test_dynamic_network_fetching(self):
         """Test dynamic network fetching examples from documentation"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        import requests
-        
         # Exact function from documentation (lines 674-698)
         def get_supported_networks(client):
             """Get current supported networks from dedicated API endpoint"""
@@ -304,6 +219,9 @@ class TestDocumentedParameterCombinations(unittest.TestCase):
             except AttributeError:
                 # If SDK doesn't have get_networks method, make direct API call
                 try:
+                    # Deferred: the requests import chain is only paid on
+                    # the fallback path that actually uses it
+                    import requests
                     api_key = client.api_key
                     headers = {'x-api-key': api_key}
                     response = requests.get('https://api.vaults.fyi/v2/networks', headers=headers)
@@ -311,92 +229,92 @@ class TestDocumentedParameterCombinations(unittest.TestCase):
                     networks = response.json()
                     return [network['name'] for network in networks]
                 except Exception as e:
-                    # Fallback to known networks (updated July 4, 2025)
-                    return [
-                        'arbitrum', 'base', 'berachain', 'bsc', 'celo', 'gnosis', 
-                        'ink', 'mainnet', 'optimism', 'polygon', 'swellchain', 'unichain', 'worldchain'
-                    ]
+                    # Fallback to known networks; shared module constant
+                    return list(_DOCUMENTED_NETWORKS)
 
         def validate_network(client, network: str) -> bool:
             """Validate network against current API data"""
-            supported_networks = get_supported_networks(client)
+            supported_networks = frozenset(get_supported_networks(client))
             return network in supported_networks
         
-        client = VaultsSdk(api_key="test_key")
-        
-        # Test function structure
-        self.assertTrue(callable(get_supported_networks))
-        self.assertTrue(callable(validate_network))
-        
-        # Test that it returns a list
-        networks = get_supported_networks(client)
+        client = self.client
+
+        # Canned responses keep both branches off the wire: the SDK path is
+        # stubbed and the direct-API fallback would hit the patched
+        # requests.get instead of api.vaults.fyi
+        from unittest.mock import patch
+
+        canned = [{'name': n} for n in _DOCUMENTED_NETWORKS]
+        with patch.object(type(client), 'get_networks', create=True,
+                          return_value=canned):
+            with patch('requests.get') as mock_get:
+                mock_get.return_value.raise_for_status = lambda: None
+                mock_get.return_value.json.return_value = canned
+                networks = get_supported_networks(client)
+
         self.assertIsInstance(networks, list)
         self.assertGreater(len(networks), 0)
     
     def test_documented_network_values(self):
         """Test all network values mentioned in documentation"""
-        # All networks from documentation (lines 28-42)
-        documented_networks = [
-            'arbitrum', 'base', 'berachain', 'bsc', 'celo', 
-            'gnosis', 'ink', 'mainnet', 'optimism', 'polygon', 
+        # One hash-based set comparison replaces the hard-coded length
+        # check and documents the canonical list (lines 28-42); adding or
+        # removing a network fails with the exact difference
+        self.assertEqual(_NETWORK_SET, frozenset({
+            'arbitrum', 'base', 'berachain', 'bsc', 'celo',
+            'gnosis', 'ink', 'mainnet', 'optimism', 'polygon',
             'swellchain', 'unichain', 'worldchain'
-        ]
-        
-        # Validate structure
-        self.assertEqual(len(documented_networks), 13, "Should have 13 networks as documented")
-        
-        for network in documented_networks:
-            self.assertIsInstance(network, str, f"Network {network} should be string")
-            self.assertEqual(network, network.lower(), f"Network {network} should be lowercase")
-            self.assertGreater(len(network), 0, f"Network {network} should not be empty")
+        }))
+        self.assertEqual(len(_DOCUMENTED_NETWORKS), len(_NETWORK_SET),
+                         "Documented networks should not contain duplicates")
+
+        # Single generator pass instead of three assertions per network
+        self.assertTrue(
+            all(_LOWER_NAME(n) for n in _DOCUMENTED_NETWORKS),
+            "All documented networks should be non-empty lowercase strings"
+        )
     
     def test_documented_asset_symbols(self):
         """Test all asset symbols mentioned in documentation"""
-        # Asset symbols from various examples
-        documented_assets = ['USDC', 'USDS', 'USDT', 'DAI', 'WBTC']
-        
-        for asset in documented_assets:
-            self.assertIsInstance(asset, str, f"Asset {asset} should be string")
-            self.assertEqual(asset, asset.upper(), f"Asset {asset} should be uppercase")
-            self.assertGreater(len(asset), 0, f"Asset {asset} should not be empty")
+        # Asset symbols from various examples; single generator pass
+        assets = ('USDC', 'USDS', 'USDT', 'DAI', 'WBTC')
+        self.assertTrue(
+            all(_UPPER_SYMBOL(a) for a in assets),
+            "All documented assets should be non-empty uppercase strings"
+        )
     
     def test_documented_action_types(self):
         """Test all action types mentioned in documentation"""
-        # Action types from documentation
-        documented_actions = ['deposit', 'redeem']
-        
-        for action in documented_actions:
-            self.assertIsInstance(action, str, f"Action {action} should be string")
-            self.assertEqual(action, action.lower(), f"Action {action} should be lowercase")
-            self.assertGreater(len(action), 0, f"Action {action} should not be empty")
-    
+        # Action types from documentation; single generator pass
+        actions = ('deposit', 'redeem')
+        self.assertTrue(
+            all(_LOWER_NAME(a) for a in actions),
+            "All documented actions should be non-empty lowercase strings"
+        )
+
+    @unittest.skipUnless(_SDK_AVAILABLE, _SDK_SKIP_REASON)
     def test_common_patterns_examples(self):
         """Test Common Patterns examples from documentation"""
-        if not self.sdk_available:
-            self.skipTest("vaultsfyi SDK not available (expected if not public yet)")
-            
-        from vaultsfyi import VaultsSdk
-        
         # Initialize client (from Common Patterns section - lines 865-866)
-        client = VaultsSdk(api_key="test_key")
-        
-        # Get all vaults (lines 868-869)
-        def get_all_vaults_pattern():
-            return client.get_all_vaults()
-        
-        # Get user positions (lines 871-872)
-        def get_positions_pattern():
-            return client.get_positions("0x...")
-        
-        # Generate deposit transaction (lines 874-875)
-        def get_actions_pattern():
-            return client.get_actions("deposit", "0x...", "mainnet", "0x...", amount="1000000")
-        
-        # Test all patterns
-        self.assertTrue(callable(get_all_vaults_pattern))
-        self.assertTrue(callable(get_positions_pattern))
-        self.assertTrue(callable(get_actions_pattern))
-    
+        client = self.client
+
+        # The Common Patterns calls (lines 868-875); each must fit the
+        # real signature, with bind_partial raising TypeError on a
+        # mismatch (as in test_endpoint_signatures)
+        patterns = (
+            ('get_all_vaults', (), {}),
+            ('get_positions', (USER_ADDR,), {}),
+            ('get_actions',
+             ('deposit', USER_ADDR, NETWORK, VAULT_ADDR),
+             {'amount': '1000000'}),
+        )
+        for name, args, kwargs in patterns:
+            with self.subTest(method=name):
+                try:
+                    inspect.signature(getattr(client, name)).bind_partial(*args, **kwargs)
+                except TypeError as e:
+                    self.fail(f"{name} does not accept documented parameters: {e}")
+
     def test_api_configuration_constants(self):
         """Test API configuration values from documentation"""
         # API configuration from documentation (lines 47-51)
@@ -419,4 +337,5 @@ class TestDocumentedParameterCombinations(unittest.TestCase):
 if __name__ == '__main__':
     print("🧪 Testing ALL Documented Python Parameter Combinations...\n")
     
-    unittest.main(verbosity=2)
\ No newline at end of file
+    # Default to dots; opt into per-test lines via TEST_VERBOSITY
+    unittest.main(verbosity=int(os.environ.get('TEST_VERBOSITY', '1')))
\ No newline at end of file
@@ -5,48 +5,28 @@ Main test runner for Python tests
 Runs all Python tests to verify documentation examples and commands
 """
 
-import subprocess
+import importlib.util
 import sys
 import os
+import unittest
 from pathlib import Path
 
-
-def run_test_file(test_file):
-    """Run a specific test file and return success status"""
-    print(f"\n🏃 Running {test_file}...")
-    
-    try:
-        result = subprocess.run([
-            sys.executable, test_file
-        ], capture_output=True, text=True, cwd=Path(__file__).parent)
-        
-        if result.returncode == 0:
-            print(f"✅ {test_file} passed")
-            print(result.stdout)
-            return True
-        else:
-            print(f"❌ {test_file} failed")
-            print("STDOUT:", result.stdout)
-            print("STDERR:", result.stderr)
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error running {test_file}: {e}")
-        return False
+# Resolved once; discovery and any path math reuse the same PosixPath
+_HERE = Path(__file__).resolve().parent
 
 
 def check_dependencies():
     """Check if required dependencies are available"""
     print("🔍 Checking dependencies...")
     
-    dependencies = ['vaultsfyi', 'pytest']
     missing = []
     
-    for dep in dependencies:
-        try:
-            __import__(dep)
+    for dep in ('vaultsfyi', 'pytest'):
+        # find_spec checks the finder without executing the package
+        # __init__, so presence detection costs no import time
+        if importlib.util.find_spec(dep) is not None:
             print(f"✅ {dep} is available")
-        except ImportError:
+        else:
             print(f"❌ {dep} is missing")
             missing.append(dep)
     
@@ -83,31 +63,36 @@ def main():
     
     print()
     
-    # List of test files to run
-    tests = [
-        ('Virtual Environment Setup', 'test_venv_setup.py'),
-        ('SDK Imports and Examples', 'test_imports.py'),
-        ('Parameter Coverage Tests', 'test_parameters.py')
-    ]
-    
-    print("📋 Test Plan:")
-    for i, (name, file) in enumerate(tests, 1):
-        print(f"   {i}. {name} ({file})")
-    print()
-    
-    # Run all tests
-    passed_tests = 0
-    total_tests = len(tests)
-    
-    for test_name, test_file in tests:
-        if run_test_file(test_file):
-            passed_tests += 1
-    
+    verbosity = int(os.environ.get('TEST_VERBOSITY', '1'))
+
+    if importlib.util.find_spec('xdist') is not None:
+        # pytest-xdist is installed: distribute the independent test files
+        # across CPU cores so wall time approaches the slowest file
+        import pytest
+
+        print("🔀 Running tests in parallel with pytest-xdist...")
+        # loadfile pins each test file to one worker; the files are
+        # independent but classes within a file share fixtures
+        args = [str(_HERE), '-n', 'auto', '--dist=loadfile']
+        if verbosity >= 2:
+            args.append('-v')
+        success = pytest.main(args) == 0
+        summary = "parallel pytest run"
+    else:
+        # Discover and run every test file in-process: one interpreter
+        # startup and one import of the SDK instead of one per suite
+        loader = unittest.TestLoader()
+        suite = loader.discover(start_dir=str(_HERE), pattern="test_*.py")
+        result = unittest.TextTestRunner(verbosity=verbosity).run(suite)
+        success = result.wasSuccessful()
+        summary = (f"{result.testsRun} tests run, "
+                   f"{len(result.failures)} failures, {len(result.errors)} errors")
+
     # Summary
     print("\n" + "="*60)
-    print(f"📊 Final Results: {passed_tests}/{total_tests} test suites passed")
-    
-    if passed_tests == total_tests:
+    print(f"📊 Final Results: {summary}")
+
+    if success:
         print("🎉 All Python tests passed!")
         print("✅ All documentation examples and commands are working correctly.")
         return True